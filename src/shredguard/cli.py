@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import os
 import re
-import subprocess
+import stat
 import sys
-from datetime import datetime, timezone
+from dataclasses import dataclass
 from pathlib import Path
 
 import click
@@ -14,22 +15,13 @@ import click
 from . import __version__
 from .config import Config, ConfigError
 from .fixer import PrefixCollisionError, apply_fixes, check_prefix_collisions
-from .git import (
-    GitError,
-    get_commits_for_branch,
-    get_current_branch,
-    get_dirty_relevant_files,
-    get_file_content,
-    get_head_sha,
-    get_local_branches,
-    get_remote_branches,
-    get_repo_root,
-    get_tracked_files,
-    is_path_in_repo,
-)
 from .gitignore import GitignoreFilter
 from .output import Formatter
-from .scanner import scan_content_bytes, scan_files
+from .scanner import scan_content_bytes, scan_files_parallel
+
+# Modules used only by the init wizard or audit (tomlkit, subprocess,
+# json, datetime, .git) are imported inside those code paths so the
+# check/fix hot path and --version/--help don't pay their import cost.
 
 
 # Common PHI patterns that users can choose from
@@ -76,30 +68,124 @@ def collect_files(
     Returns:
         List of files to scan.
     """
-    files: list[Path] = []
+    files: set[Path] = set()
 
     for path in paths:
-        if path.is_file():
+        # One stat per argument; is_file() + is_dir() would stat twice
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:
+            continue
+        if stat.S_ISREG(mode):
             if not gitignore_filter.is_ignored(path):
-                files.append(path)
-        elif path.is_dir():
-            if all_files:
-                # Recursively collect all files
-                for file_path in path.rglob("*"):
-                    if file_path.is_file() and not gitignore_filter.is_ignored(
-                        file_path
+                files.add(path)
+        elif stat.S_ISDIR(mode):
+            # Iterative scandir walk. Checking directories lets us prune
+            # entire ignored subtrees (e.g. node_modules/) without
+            # descending into them, unlike rglob which visits every entry.
+            stack = [path]
+            while stack:
+                current = stack.pop()
+                try:
+                    entries = list(os.scandir(current))
+                except OSError:
+                    continue
+                for entry in entries:
+                    entry_path = Path(entry.path)
+                    # Descend only into real directories (following
+                    # symlinked ones could loop), but classify files
+                    # with symlinks followed: a symlink to a regular
+                    # file must be scanned like the file itself.
+                    if entry.is_dir(follow_symlinks=False):
+                        if not gitignore_filter.is_ignored(entry_path):
+                            stack.append(entry_path)
+                    elif entry.is_file() and not gitignore_filter.is_ignored(
+                        entry_path
                     ):
-                        files.append(file_path)
-            else:
-                # Only collect files directly passed (not recursive by default)
-                # When a directory is passed without --all-files, we still scan it
-                for file_path in path.rglob("*"):
-                    if file_path.is_file() and not gitignore_filter.is_ignored(
-                        file_path
-                    ):
-                        files.append(file_path)
+                        files.add(entry_path)
+
+    return sorted(files)
+
+
+def _resolve_scan_base(files: tuple[Path, ...]) -> Path:
+    """Resolve the base directory covering all given paths.
 
-    return sorted(set(files))
+    Using the common parent (rather than the first path's parent) means
+    every file is filtered against its nearest .gitignore even when
+    paths from several subdirectories are passed, as pre-commit does.
+
+    The common parent of unrelated arguments degenerates to the
+    filesystem root (or raises on Windows when drives differ), and the
+    gitignore filter walks the base looking for .gitignore files — so
+    a degenerate base would walk the whole disk. Fall back to the first
+    path's parent in those cases; it's a plausible project root, which
+    the filesystem root never is.
+    """
+    resolved = [p.resolve() for p in files]
+    try:
+        base = Path(os.path.commonpath([str(p) for p in resolved]))
+    except ValueError:
+        # Windows: arguments on different drives share no common path
+        base = None
+    if base is not None and base.is_file():
+        base = base.parent
+    if base is None or base == base.parent:
+        first = resolved[0]
+        base = first if first.is_dir() else first.parent
+    return base
+
+
+@functools.cache
+def _gitignore_filter_for(base_path: Path, respect_gitignore: bool) -> GitignoreFilter:
+    """Build (or reuse) a GitignoreFilter for a base directory.
+
+    Construction walks the tree for .gitignore files, so the result is
+    cached for repeated in-process invocations with the same base.
+    """
+    return GitignoreFilter(base_path, respect_gitignore=respect_gitignore)
+
+
+@dataclass
+class PreparedScan:
+    """Everything check/fix need before scanning starts."""
+
+    config: Config
+    base_path: Path
+    file_list: list[Path]
+
+
+def _prepare_scan(
+    files: tuple[Path, ...],
+    all_files: bool,
+    no_gitignore: bool,
+    config_path: Path | None,
+    formatter: Formatter,
+) -> PreparedScan:
+    """Shared pre-scan pipeline for check and fix.
+
+    Loads config, resolves the scan base, builds the gitignore filter,
+    and collects files. Exits on config errors (code 1) or when there
+    is nothing to scan (code 0), matching both commands' behavior.
+    """
+    try:
+        config = Config.load(config_path)
+    except ConfigError as e:
+        click.echo(formatter.format_error(str(e)), err=True)
+        sys.exit(1)
+
+    # Default to current directory if no files specified
+    if not files:
+        files = (Path("."),)
+
+    base_path = _resolve_scan_base(files)
+    gitignore_filter = _gitignore_filter_for(base_path, not no_gitignore)
+    file_list = collect_files(files, all_files, gitignore_filter)
+
+    if not file_list:
+        click.echo(formatter.format_warning("No files to scan"))
+        sys.exit(0)
+
+    return PreparedScan(config=config, base_path=base_path, file_list=file_list)
 
 
 @click.group()
@@ -109,11 +195,50 @@ def main() -> None:
     pass
 
 
+def _report_check_results(
+    matches: list,
+    binary_files: list[Path],
+    pattern_count: int,
+    base_path: Path | None,
+    formatter: Formatter,
+    verbose: bool,
+) -> None:
+    """Emit the check report and exit with the appropriate code."""
+    # Show verbose output for skipped binary files, batched into one write
+    if verbose and binary_files:
+        click.echo(
+            "\n".join(formatter.format_verbose_binary_skip(bf) for bf in binary_files),
+            err=True,
+        )
+
+    # Build the report (matches plus summary) and emit it in one write
+    output_parts: list[str] = []
+    if matches:
+        output_parts.append(formatter.format_matches(matches, base_path))
+        output_parts.append("")
+
+    # Matches arrive sorted by file, so distinct files can be counted
+    # from transitions without hashing a Path per match.
+    files_with_matches = 0
+    previous_file = None
+    for m in matches:
+        if m.file != previous_file:
+            files_with_matches += 1
+            previous_file = m.file
+    output_parts.append(
+        formatter.format_check_summary(len(matches), files_with_matches, pattern_count)
+    )
+    click.echo("\n".join(output_parts))
+
+    # Exit with error if matches found
+    sys.exit(1 if matches else 0)
+
+
 @main.command()
 @click.argument(
     "files",
     nargs=-1,
-    type=click.Path(exists=True, path_type=Path),
+    type=click.Path(exists=True, path_type=Path, allow_dash=True),
 )
 @click.option(
     "--all-files",
@@ -137,70 +262,75 @@ def main() -> None:
     is_flag=True,
     help="Show verbose output (skipped files, etc.).",
 )
+@click.option(
+    "--fast",
+    is_flag=True,
+    help=(
+        "Stop scanning each file at its first match. Faster when only "
+        "the exit status matters; reports at most one match per file."
+    ),
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=None,
+    help="Number of worker processes for scanning (default: CPU count).",
+)
 def check(
     files: tuple[Path, ...],
     all_files: bool,
     no_gitignore: bool,
     config_path: Path | None,
     verbose: bool,
+    fast: bool,
+    jobs: int | None,
 ) -> None:
     """Scan files for PHI patterns.
 
     FILES are the files or directories to scan. If not specified,
-    scans the current directory.
+    scans the current directory. Pass '-' to scan standard input.
     """
     formatter = Formatter()
 
-    # Load configuration
-    try:
-        config = Config.load(config_path)
-    except ConfigError as e:
-        click.echo(formatter.format_error(str(e)), err=True)
-        sys.exit(1)
-
-    # Default to current directory if no files specified
-    if not files:
-        files = (Path("."),)
-
-    # Set up gitignore filter - use the first directory/file's parent as base
-    # for finding .gitignore files
-    first_path = files[0]
-    if first_path.is_dir():
-        base_path = first_path.resolve()
-    else:
-        base_path = first_path.parent.resolve()
-    gitignore_filter = GitignoreFilter(base_path, respect_gitignore=not no_gitignore)
-
-    # Collect files to scan
-    file_list = collect_files(files, all_files, gitignore_filter)
+    # '-' scans stdin entirely in memory: no file collection, no
+    # gitignore walk, no filesystem reads.
+    if any(str(f) == "-" for f in files):
+        if len(files) > 1:
+            raise click.UsageError("'-' cannot be combined with other paths")
+        try:
+            config = Config.load(config_path)
+        except ConfigError as e:
+            click.echo(formatter.format_error(str(e)), err=True)
+            sys.exit(1)
+        content = click.get_binary_stream("stdin").read()
+        matches, was_binary = scan_content_bytes(
+            content, Path("<stdin>"), config.patterns, fast_scan=fast
+        )
+        # scan_content_bytes returns matches in pattern order; report in
+        # position order like every file-based path does.
+        matches.sort(key=lambda m: (m.line, m.column))
+        binary_files = [Path("<stdin>")] if was_binary else []
+        _report_check_results(
+            matches, binary_files, len(config.patterns), None, formatter, verbose
+        )
 
-    if not file_list:
-        click.echo(formatter.format_warning("No files to scan"))
-        sys.exit(0)
+    prepared = _prepare_scan(files, all_files, no_gitignore, config_path, formatter)
+    config = prepared.config
 
     # Scan files
-    matches, binary_files = scan_files(file_list, config.patterns, verbose=verbose)
-
-    # Show verbose output for skipped binary files
-    if verbose and binary_files:
-        for bf in binary_files:
-            click.echo(formatter.format_verbose_binary_skip(bf), err=True)
-
-    # Output matches
-    if matches:
-        click.echo(formatter.format_matches(matches, base_path))
-        click.echo()
-
-    # Output summary
-    files_with_matches = len({m.file for m in matches})
-    click.echo(
-        formatter.format_check_summary(
-            len(matches), files_with_matches, len(config.patterns)
-        )
+    matches, binary_files = scan_files_parallel(
+        prepared.file_list, config.patterns, jobs=jobs, verbose=verbose, fast_scan=fast
     )
 
-    # Exit with error if matches found
-    sys.exit(1 if matches else 0)
+    _report_check_results(
+        matches,
+        binary_files,
+        len(config.patterns),
+        prepared.base_path,
+        formatter,
+        verbose,
+    )
 
 
 @main.command()
@@ -242,6 +372,21 @@ def check(
     type=click.Path(path_type=Path),
     help="Path to write JSON mapping of original values to pseudonyms.",
 )
+@click.option(
+    "--deterministic",
+    is_flag=True,
+    help=(
+        "Assign pseudonyms in sorted order of original value instead of "
+        "encounter order, so the mapping is stable across runs."
+    ),
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=None,
+    help="Number of worker processes for scanning (default: CPU count).",
+)
 def fix(
     files: tuple[Path, ...],
     all_files: bool,
@@ -250,6 +395,8 @@ def fix(
     verbose: bool,
     prefix: str,
     output_map: Path | None,
+    deterministic: bool,
+    jobs: int | None,
 ) -> None:
     """Replace PHI patterns with pseudonyms.
 
@@ -257,33 +404,9 @@ def fix(
     scans the current directory.
     """
     formatter = Formatter()
-
-    # Load configuration
-    try:
-        config = Config.load(config_path)
-    except ConfigError as e:
-        click.echo(formatter.format_error(str(e)), err=True)
-        sys.exit(1)
-
-    # Default to current directory if no files specified
-    if not files:
-        files = (Path("."),)
-
-    # Set up gitignore filter - use the first directory/file's parent as base
-    # for finding .gitignore files
-    first_path = files[0]
-    if first_path.is_dir():
-        base_path = first_path.resolve()
-    else:
-        base_path = first_path.parent.resolve()
-    gitignore_filter = GitignoreFilter(base_path, respect_gitignore=not no_gitignore)
-
-    # Collect files to scan
-    file_list = collect_files(files, all_files, gitignore_filter)
-
-    if not file_list:
-        click.echo(formatter.format_warning("No files to scan"))
-        sys.exit(0)
+    prepared = _prepare_scan(files, all_files, no_gitignore, config_path, formatter)
+    config = prepared.config
+    file_list = prepared.file_list
 
     # Check for prefix collisions in ALL files before scanning for patterns
     collisions = check_prefix_collisions(file_list, prefix)
@@ -297,12 +420,16 @@ def fix(
         sys.exit(1)
 
     # Scan files
-    matches, binary_files = scan_files(file_list, config.patterns, verbose=verbose)
+    matches, binary_files = scan_files_parallel(
+        file_list, config.patterns, jobs=jobs, verbose=verbose
+    )
 
-    # Show verbose output for skipped binary files
+    # Show verbose output for skipped binary files, batched into one write
     if verbose and binary_files:
-        for bf in binary_files:
-            click.echo(formatter.format_verbose_binary_skip(bf), err=True)
+        click.echo(
+            "\n".join(formatter.format_verbose_binary_skip(bf) for bf in binary_files),
+            err=True,
+        )
 
     if not matches:
         click.echo(
@@ -322,7 +449,7 @@ def fix(
 
     # Apply fixes
     try:
-        result = apply_fixes(matches, prefix, output_map)
+        result = apply_fixes(matches, prefix, output_map, deterministic=deterministic)
     except PrefixCollisionError as e:
         click.echo(formatter.format_prefix_collision_error(e), err=True)
         sys.exit(1)
@@ -397,7 +524,12 @@ def init() -> None:
         click.secho(f"      regex: {pattern['regex']}", fg="bright_black")
 
         if click.confirm("      Include this pattern?", default=True):
-            selected_patterns.append(pattern.copy())
+            selected_patterns.append(
+                {
+                    "regex": pattern["regex"],
+                    "description": pattern["description"],
+                }
+            )
         click.echo()
 
     # Step 4: Add custom patterns
@@ -413,7 +545,7 @@ def init() -> None:
         description = click.prompt("  Pattern description (e.g., 'Patient ID')")
         regex = click.prompt("  Regex pattern")
 
-        # Validate the regex
+        # Validate the regex before accepting the pattern
         try:
             re.compile(regex)
             selected_patterns.append(
@@ -566,6 +698,18 @@ def _generate_config_content(
 
     lines.append("")
 
+    # The file restriction lines are identical for every pattern, so
+    # build them once outside the loop
+    includes_line = None
+    if include_files:
+        files_str = ", ".join(f'"{f}"' for f in include_files)
+        includes_line = f"files = [{files_str}]"
+
+    excludes_line = None
+    if exclude_files:
+        exclude_str = ", ".join(f'"{f}"' for f in exclude_files)
+        excludes_line = f"exclude_files = [{exclude_str}]"
+
     for pattern in patterns:
         lines.append("[[tool.shredguard.patterns]]")
         # Escape backslashes for TOML
@@ -573,13 +717,11 @@ def _generate_config_content(
         lines.append(f'regex = "{escaped_regex}"')
         lines.append(f'description = "{pattern["description"]}"')
 
-        if include_files:
-            files_str = ", ".join(f'"{f}"' for f in include_files)
-            lines.append(f"files = [{files_str}]")
+        if includes_line:
+            lines.append(includes_line)
 
-        if exclude_files:
-            exclude_str = ", ".join(f'"{f}"' for f in exclude_files)
-            lines.append(f"exclude_files = [{exclude_str}]")
+        if excludes_line:
+            lines.append(excludes_line)
 
         lines.append("")
 
@@ -588,55 +730,31 @@ def _generate_config_content(
 
 def _update_pyproject_toml(path: Path, new_shredguard_content: str) -> None:
     """Update pyproject.toml by replacing existing ShredGuard section."""
-    content = path.read_text()
+    import tomlkit
 
-    # Find and remove existing [tool.shredguard] section
-    # This is a simple approach - for complex cases, use tomlkit
-    lines = content.split("\n")
-    new_lines = []
-    in_shredguard_section = False
+    doc = tomlkit.parse(path.read_text())
 
-    for line in lines:
-        if line.strip().startswith("[tool.shredguard]"):
-            in_shredguard_section = True
-            continue
-        elif line.strip().startswith("[[tool.shredguard."):
-            in_shredguard_section = True
-            continue
-        elif in_shredguard_section:
-            # Check if we've hit a new section
-            if line.strip().startswith("[") and not line.strip().startswith(
-                "[[tool.shredguard"
-            ):
-                in_shredguard_section = False
-                new_lines.append(line)
-        else:
-            new_lines.append(line)
-
-    # Remove trailing empty lines and add the new content
-    while new_lines and not new_lines[-1].strip():
-        new_lines.pop()
+    # Drop the existing [tool.shredguard] table (and its pattern tables)
+    # via the parsed document, which handles edge cases like inline
+    # arrays containing '[' that line-based scanning would corrupt.
+    tool = doc.get("tool")
+    if tool is not None and "shredguard" in tool:
+        del tool["shredguard"]
 
-    new_lines.append("")
-    new_lines.append(new_shredguard_content)
-
-    path.write_text("\n".join(new_lines))
+    content = tomlkit.dumps(doc).rstrip("\n")
+    path.write_text(content + "\n\n" + new_shredguard_content)
 
 
 def _setup_precommit(formatter: Formatter) -> None:
     """Set up pre-commit hooks for ShredGuard."""
+    import shutil
+    import subprocess
+
     precommit_config_path = Path(".pre-commit-config.yaml")
 
-    # Check if pre-commit is installed
-    try:
-        subprocess.run(
-            ["pre-commit", "--version"],
-            capture_output=True,
-            check=True,
-        )
-        precommit_installed = True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        precommit_installed = False
+    # Check if pre-commit is installed. A PATH lookup is enough here and
+    # avoids spawning an interpreter just to probe for the executable.
+    precommit_installed = shutil.which("pre-commit") is not None
 
     if not precommit_installed:
         click.echo()
@@ -764,6 +882,23 @@ def audit(
     uncommitted changes to these files so the audit is reproducible and can be
     anchored to a specific commit.
     """
+    import json
+    from datetime import datetime, timezone
+
+    from .git import (
+        GitError,
+        get_commits_for_branch,
+        get_current_branch,
+        get_dirty_relevant_files,
+        get_file_content,
+        get_head_sha,
+        get_local_branches,
+        get_remote_branches,
+        get_repo_root,
+        get_tracked_files,
+        is_path_in_repo,
+    )
+
     formatter = Formatter()
     now = datetime.now(timezone.utc)
     command_str = " ".join(sys.argv)
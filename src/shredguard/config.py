@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import fnmatch
+import os
 import re
 import sys
 from dataclasses import dataclass, field
@@ -12,12 +14,42 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib
 
+# Optional linear-time regex engine (guaranteed no catastrophic
+# backtracking). Patterns it can't handle fall back to the stdlib engine.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid or missing."""
 
 
-@dataclass
+# Parsed TOML documents keyed by (resolved path, mtime_ns, size), so
+# repeated loads in one process skip the parse when the file is unchanged.
+_TOML_CACHE: dict[tuple[str, int, int], dict] = {}
+
+# Fully-built Config objects under the same key, so repeated loads also
+# skip Pattern.from_dict (and its regex compilation), not just the parse.
+# Error paths are not cached: a file without [tool.shredguard] must keep
+# raising so Config.load's parent-directory search works.
+_CONFIG_CACHE: dict[tuple[str, int, int], Config] = {}
+
+
+# Compiled pattern objects keyed by regex source. Invalid regexes are
+# not cached; they keep raising ConfigError with the pattern's index.
+_COMPILED: dict[str, re.Pattern[str]] = {}
+
+
+def _compile_globs(globs: list[str]) -> re.Pattern[str] | None:
+    """Union of fnmatch-translated globs, or None when the list is empty."""
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(g)) for g in globs))
+
+
+@dataclass(slots=True)
 class Pattern:
     """A pattern to scan for in files."""
 
@@ -27,6 +59,22 @@ class Pattern:
     compiled: re.Pattern[str] = field(repr=False)
     files: list[str] = field(default_factory=list)
     exclude_files: list[str] = field(default_factory=list)
+    include_re: re.Pattern[str] | None = field(default=None, repr=False)
+    exclude_re: re.Pattern[str] | None = field(default=None, repr=False)
+
+    def matches_file(self, path_str: str, name: str) -> bool:
+        """Check this pattern's file globs against a (normcased) path.
+
+        Same semantics as the glob lists, but via regexes compiled once
+        in from_dict rather than re-translating each glob per call.
+        """
+        if self.exclude_re is not None and (
+            self.exclude_re.match(name) or self.exclude_re.match(path_str)
+        ):
+            return False
+        if self.include_re is None:
+            return True
+        return bool(self.include_re.match(name) or self.include_re.match(path_str))
 
     @classmethod
     def from_dict(cls, data: dict, index: int) -> Pattern:
@@ -37,12 +85,26 @@ class Pattern:
 
         description = data.get("description", f"Pattern {index + 1}")
 
-        try:
-            compiled = re.compile(regex)
-        except re.error as e:
-            raise ConfigError(
-                f"Invalid regex in pattern {index + 1} ({description!r}): {e}"
-            ) from e
+        # Identical regex strings (the same config loaded under different
+        # keys, or shared patterns across configs) reuse one compiled
+        # object instead of recompiling per Pattern instantiation.
+        compiled = _COMPILED.get(regex)
+        if compiled is None:
+            try:
+                compiled = re.compile(regex)
+            except re.error as e:
+                raise ConfigError(
+                    f"Invalid regex in pattern {index + 1} ({description!r}): {e}"
+                ) from e
+
+            # Prefer RE2 where available and the pattern is supported
+            # (RE2 rejects backreferences and lookarounds).
+            if _re2 is not None:
+                try:
+                    compiled = _re2.compile(regex)
+                except _re2.error:
+                    pass
+            _COMPILED[regex] = compiled
 
         code = f"SG{index + 1:03d}"
 
@@ -61,6 +123,8 @@ class Pattern:
             compiled=compiled,
             files=files,
             exclude_files=exclude_files,
+            include_re=_compile_globs(files),
+            exclude_re=_compile_globs(exclude_files),
         )
 
 
@@ -119,14 +183,24 @@ class Config:
     @classmethod
     def _load_from_file(cls, path: Path) -> Config:
         """Load configuration from a specific file."""
-        if not path.exists():
-            raise ConfigError(f"Config file not found: {path}")
-
         try:
-            with open(path, "rb") as f:
-                data = tomllib.load(f)
-        except tomllib.TOMLDecodeError as e:
-            raise ConfigError(f"Invalid TOML in {path}: {e}") from e
+            st = path.stat()
+        except OSError:
+            raise ConfigError(f"Config file not found: {path}") from None
+
+        cache_key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        data = _TOML_CACHE.get(cache_key)
+        if data is None:
+            try:
+                with open(path, "rb") as f:
+                    data = tomllib.load(f)
+            except tomllib.TOMLDecodeError as e:
+                raise ConfigError(f"Invalid TOML in {path}: {e}") from e
+            _TOML_CACHE[cache_key] = data
 
         # Navigate to [tool.shredguard] section
         tool_section = data.get("tool", {})
@@ -150,4 +224,6 @@ class Config:
         for i, pattern_data in enumerate(patterns_data):
             patterns.append(Pattern.from_dict(pattern_data, i))
 
-        return cls(patterns=patterns, config_path=path)
+        config = cls(patterns=patterns, config_path=path)
+        _CONFIG_CACHE[cache_key] = config
+        return config
@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import json
+import os
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from .scanner import Match
+from .scanner import Match, _line_start_index
+
+# Optional fast JSON serializer for the mapping file; output is plain
+# UTF-8 JSON either way, so readers never notice which one produced it.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+@functools.cache
+def _collision_pattern(prefix: str) -> re.Pattern[str]:
+    """Compiled PREFIX-digits pattern, cached per prefix."""
+    return re.compile(re.escape(prefix) + r"-\d+")
 
 
 class PrefixCollisionError(Exception):
@@ -37,7 +54,6 @@ class Fixer:
 
     prefix: str
     _mapping: dict[str, str] = field(default_factory=dict, init=False)
-    _next_id: int = field(default=0, init=False)
 
     def get_pseudonym(self, original: str) -> str:
         """Get or create a pseudonym for a value.
@@ -50,10 +66,16 @@ class Fixer:
         Returns:
             The pseudonym (e.g., "REDACTED-0").
         """
-        if original not in self._mapping:
-            self._mapping[original] = f"{self.prefix}-{self._next_id}"
-            self._next_id += 1
-        return self._mapping[original]
+        # One hash probe on the hot (already-seen) path instead of the
+        # three a membership test + two indexings would cost. len() of
+        # the mapping doubles as the next ID: it equals the number of
+        # values assigned so far, so a separate counter is redundant.
+        mapping = self._mapping
+        pseudonym = mapping.get(original)
+        if pseudonym is None:
+            pseudonym = f"{self.prefix}-{len(mapping)}"
+            mapping[original] = pseudonym
+        return pseudonym
 
     @property
     def mapping(self) -> dict[str, str]:
@@ -61,6 +83,32 @@ class Fixer:
         return dict(self._mapping)
 
 
+def has_prefix_collision(files: list[Path], prefix: str) -> bool:
+    """Check whether any file already contains a PREFIX-digits value.
+
+    Early-exits on the first hit. Use check_prefix_collisions when the
+    individual locations are needed for reporting.
+
+    Args:
+        files: List of files to check.
+        prefix: The prefix to check for.
+
+    Returns:
+        True if at least one collision exists.
+    """
+    pattern = _collision_pattern(prefix)
+
+    for file_path in files:
+        try:
+            content = file_path.read_bytes().decode("utf-8", "replace")
+        except OSError:
+            continue
+        if prefix in content and pattern.search(content) is not None:
+            return True
+
+    return False
+
+
 def check_prefix_collisions(
     files: list[Path], prefix: str
 ) -> list[tuple[Path, int, str]]:
@@ -73,24 +121,77 @@ def check_prefix_collisions(
     Returns:
         List of (file, line_number, matched_text) tuples for collisions.
     """
-    # Escape prefix for regex and look for PREFIX-digits pattern
-    pattern = re.compile(re.escape(prefix) + r"-\d+")
+    pattern = _collision_pattern(prefix)
     collisions: list[tuple[Path, int, str]] = []
 
     for file_path in files:
         try:
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                for line_num, line in enumerate(f, 1):
-                    for match in pattern.finditer(line):
-                        collisions.append((file_path, line_num, match.group()))
+            content = file_path.read_bytes().decode("utf-8", "replace")
         except OSError:
             continue
 
+        # Fast substring pre-check: most files contain no occurrence of
+        # the prefix at all, and `in` runs in C, so the per-line regex
+        # pass is skipped entirely for them.
+        if prefix not in content:
+            continue
+
+        # Line numbers via the scanner's line-start index — one pass
+        # over the content instead of a newline count per hit
+        line_starts = _line_start_index(content)
+        for match in pattern.finditer(content):
+            line_num = bisect.bisect_right(line_starts, match.start())
+            collisions.append((file_path, line_num, match.group()))
+
     return collisions
 
 
+def _dump_mapping(mapping: dict[str, str]) -> str:
+    """Serialize the mapping to indented JSON, via orjson when available.
+
+    orjson serializes roughly an order of magnitude faster than stdlib
+    json, which shows on mappings with very many unique values. Both
+    emit 2-space-indented JSON with non-ASCII characters as raw UTF-8
+    (orjson always does; ensure_ascii=False makes stdlib json match),
+    so the bytes on disk are identical whichever engine produced them —
+    which --deterministic relies on across environments.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(mapping, option=_orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(mapping, ensure_ascii=False, indent=2)
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write content to path via a sibling temp file and os.replace.
+
+    An interrupted run leaves either the old file or the new one on
+    disk, never a partially written file — which matters here because
+    the fixer rewrites the user's source files in place. The temp file
+    sits next to the target so the rename stays on one filesystem.
+    newline="" writes the content back verbatim, matching the
+    translation-free reads in apply_fixes.
+    """
+    tmp_path = path.with_name(path.name + ".shredguard.tmp")
+    try:
+        mode = path.stat().st_mode
+    except OSError:
+        mode = None
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def apply_fixes(
-    matches: list[Match], prefix: str, output_map: Path | None = None
+    matches: list[Match],
+    prefix: str,
+    output_map: Path | None = None,
+    deterministic: bool = False,
 ) -> FixResult:
     """Apply fixes to all matched files.
 
@@ -98,6 +199,9 @@ def apply_fixes(
         matches: List of matches to fix.
         prefix: Prefix for pseudonyms.
         output_map: Optional path to write JSON mapping.
+        deterministic: Assign pseudonyms in sorted order of original
+            value instead of encounter order, so the same set of values
+            always produces the same mapping regardless of file order.
 
     Returns:
         FixResult with statistics.
@@ -113,30 +217,44 @@ def apply_fixes(
             mapping={},
         )
 
-    # Get unique files
-    files = list({m.file for m in matches})
+    # Get unique files (insertion-ordered, single pass)
+    files = list(dict.fromkeys(m.file for m in matches))
 
-    # Check for prefix collisions first
-    collisions = check_prefix_collisions(files, prefix)
-    if collisions:
-        raise PrefixCollisionError(prefix, collisions)
+    # Check for prefix collisions first. The boolean probe stops at the
+    # first hit; the full location scan runs only on the error path.
+    if has_prefix_collision(files, prefix):
+        raise PrefixCollisionError(prefix, check_prefix_collisions(files, prefix))
 
     fixer = Fixer(prefix=prefix)
 
+    # Sorted pre-assignment makes the mapping (and thus the mapping
+    # file) a pure function of the value set: re-runs and reordered
+    # file lists produce byte-identical output, which keeps mapping
+    # files diffable across runs. Encounter order stays the default.
+    if deterministic:
+        for text in sorted({m.matched_text for m in matches}):
+            fixer.get_pseudonym(text)
+
     # Group matches by file
-    matches_by_file: dict[Path, list[Match]] = {}
+    matches_by_file: dict[Path, list[Match]] = defaultdict(list)
     for match in matches:
-        if match.file not in matches_by_file:
-            matches_by_file[match.file] = []
         matches_by_file[match.file].append(match)
 
     files_modified = 0
     total_replacements = 0
 
+    # Files usually share one repo-wide set of matched values, so cache
+    # the compiled alternation by its text tuple instead of recompiling
+    # per file. Keyed per file's own texts (not one global union): a
+    # global pattern would replace values in files where a glob-scoped
+    # pattern never actually matched them.
+    compiled_cache: dict[tuple[str, ...], re.Pattern[str]] = {}
+
     for file_path, file_matches in matches_by_file.items():
+        # Bytes read + one-shot decode skips the TextIOWrapper
+        # incremental decoder and leaves line endings untouched
         try:
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
+            content = file_path.read_bytes().decode("utf-8", "replace")
         except OSError:
             continue
 
@@ -156,18 +274,22 @@ def apply_fixes(
                 unique_texts.append(m.matched_text)
                 seen.add(m.matched_text)
 
-        # Apply replacements
-        new_content = content
-        for text in unique_texts:
-            pseudonym = fixer.get_pseudonym(text)
-            new_content = new_content.replace(text, pseudonym)
-
-        # Count replacements in this file
-        file_replacement_count = sum(content.count(text) for text in unique_texts)
+        # Apply all replacements in one pass. The alternation is ordered
+        # longest-first (unique_texts already is), so longer matches win
+        # at a shared position; subn also yields the replacement count
+        # directly instead of re-counting per text.
+        replacement_map = {text: fixer.get_pseudonym(text) for text in unique_texts}
+        cache_key = tuple(unique_texts)
+        file_pattern = compiled_cache.get(cache_key)
+        if file_pattern is None:
+            file_pattern = re.compile("|".join(re.escape(t) for t in unique_texts))
+            compiled_cache[cache_key] = file_pattern
+        new_content, file_replacement_count = file_pattern.subn(
+            lambda m, _map=replacement_map: _map[m.group(0)], content
+        )
 
         if new_content != content:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
+            _atomic_write_text(file_path, new_content)
             files_modified += 1
             total_replacements += file_replacement_count
 
@@ -175,8 +297,7 @@ def apply_fixes(
     mapping = fixer.mapping
     if output_map is not None:
         output_map.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_map, "w", encoding="utf-8") as f:
-            json.dump(mapping, f, indent=2)
+        _atomic_write_text(output_map, _dump_mapping(mapping))
 
     return FixResult(
         files_modified=files_modified,
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
 
 import pathspec
 
 
+@functools.lru_cache(maxsize=4096)
+def _resolved(path: Path) -> Path:
+    """Cached Path.resolve — the same paths (directories especially)
+    are queried repeatedly during a scan, and realpath is syscall-heavy."""
+    return path.resolve()
+
+
 def find_gitignore_files(root: Path) -> list[Path]:
     """Find all .gitignore files in a directory tree.
 
@@ -30,11 +39,36 @@ def find_gitignore_files(root: Path) -> list[Path]:
     # Reverse so root-level comes first
     gitignores.extend(reversed(parent_gitignores))
 
-    # Then find .gitignore files within the root directory
+    # Then find .gitignore files within the root directory. An explicit
+    # scandir walk matches .gitignore entries by name from the directory
+    # listing itself — rglob built a Path object for every entry in the
+    # tree just to compare names. DirEntry.is_file/is_dir reuse the stat
+    # info the listing already fetched, so most entries cost no extra
+    # syscall. .git is skipped: git itself never reads .gitignore files
+    # from inside it.
     if root.is_dir():
-        for gitignore in sorted(root.rglob(".gitignore")):
-            if gitignore not in gitignores:
+        seen = set(gitignores)
+        found: list[Path] = []
+        stack = [str(root)]
+        while stack:
+            current_dir = stack.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name != ".git":
+                                    stack.append(entry.path)
+                            elif entry.name == ".gitignore":
+                                found.append(Path(entry.path))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        for gitignore in sorted(found):
+            if gitignore not in seen:
                 gitignores.append(gitignore)
+                seen.add(gitignore)
 
     return gitignores
 
@@ -67,20 +101,55 @@ class GitignoreFilter:
         self.root = root.resolve()
         self.respect_gitignore = respect_gitignore
         self._specs: list[tuple[Path, pathspec.PathSpec]] = []
+        # Per-directory ignore decisions; every file in a directory
+        # shares its ancestors' answers, so memoize at that granularity
+        self._dir_cache: dict[Path, bool] = {}
 
         if respect_gitignore:
             self._load_gitignores()
 
     def _load_gitignores(self) -> None:
-        """Load all .gitignore files."""
-        for gitignore_path in find_gitignore_files(self.root):
-            try:
-                spec = load_gitignore_spec(gitignore_path)
-                # Store the directory containing the .gitignore
-                self._specs.append((gitignore_path.parent.resolve(), spec))
-            except OSError:
-                # Skip unreadable .gitignore files
-                pass
+        """Load all .gitignore files, pruning ignored subtrees."""
+        seen: set[Path] = set()
+
+        # Parent directories first, so root-level rules come first
+        current = self.root
+        parent_gitignores = []
+        while current != current.parent:
+            gitignore = current / ".gitignore"
+            if gitignore.exists():
+                parent_gitignores.append(gitignore)
+            current = current.parent
+        for gitignore_path in reversed(parent_gitignores):
+            self._add_spec(gitignore_path, seen)
+
+        if not self.root.is_dir():
+            return
+
+        # Walk the tree top-down, consulting the specs accumulated so
+        # far to skip subtrees (node_modules/, .venv/, ...) that an
+        # outer .gitignore already excludes — rglob would stat through
+        # all of them.
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dir_path = Path(dirpath)
+            if ".gitignore" in filenames:
+                self._add_spec(dir_path / ".gitignore", seen)
+            dirnames[:] = sorted(
+                d for d in dirnames if not self.is_ignored(dir_path / d)
+            )
+
+    def _add_spec(self, gitignore_path: Path, seen: set[Path]) -> None:
+        """Load one .gitignore into the spec list, skipping duplicates."""
+        if gitignore_path in seen:
+            return
+        seen.add(gitignore_path)
+        try:
+            spec = load_gitignore_spec(gitignore_path)
+        except OSError:
+            # Skip unreadable .gitignore files
+            return
+        # Store the directory containing the .gitignore
+        self._specs.append((gitignore_path.parent.resolve(), spec))
 
     def is_ignored(self, path: Path) -> bool:
         """Check if a path should be ignored.
@@ -94,28 +163,49 @@ class GitignoreFilter:
         if not self.respect_gitignore:
             return False
 
-        path = path.resolve()
-
+        path = _resolved(path)
+
+        if path.is_dir():
+            return self._dir_ignored(path)
+
+        # A file is ignored if any ancestor directory is (git does not
+        # re-include files inside excluded directories) or if a spec
+        # matches the file itself
+        return self._dir_ignored(path.parent) or self._match_specs(path, False)
+
+    def _dir_ignored(self, directory: Path) -> bool:
+        """Cached check: is this directory or any ancestor ignored?"""
+        cached = self._dir_cache.get(directory)
+        if cached is None:
+            if directory == self.root or directory == directory.parent:
+                cached = False
+            else:
+                cached = self._dir_ignored(directory.parent) or self._match_specs(
+                    directory, True
+                )
+            self._dir_cache[directory] = cached
+        return cached
+
+    def _match_specs(self, path: Path, is_dir: bool) -> bool:
+        """Match an already-resolved path against every loaded spec."""
         for gitignore_dir, spec in self._specs:
             # Calculate path relative to the .gitignore's directory
             try:
                 rel_path = path.relative_to(gitignore_dir)
-                rel_str = str(rel_path)
-
-                # pathspec expects forward slashes
-                rel_str = rel_str.replace("\\", "/")
-
-                if spec.match_file(rel_str):
-                    return True
-
-                # Also check with trailing slash for directories
-                if path.is_dir() and spec.match_file(rel_str + "/"):
-                    return True
-
             except ValueError:
                 # Path is not relative to this .gitignore's directory
                 continue
 
+            # pathspec expects forward slashes
+            rel_str = str(rel_path).replace("\\", "/")
+
+            if spec.match_file(rel_str):
+                return True
+
+            # Also check with trailing slash for directories
+            if is_dir and spec.match_file(rel_str + "/"):
+                return True
+
         return False
 
     def filter_paths(self, paths: list[Path]) -> list[Path]:
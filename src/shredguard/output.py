@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 
@@ -23,8 +24,13 @@ class Colors:
     DIM = "\033[2m"
 
 
+@functools.cache
 def supports_color() -> bool:
-    """Check if the terminal supports color output."""
+    """Check if the terminal supports color output.
+
+    Cached: the environment and stdout's tty-ness don't change over a
+    process lifetime, and a Formatter is built per command invocation.
+    """
     # Check for NO_COLOR environment variable
     import os
 
@@ -42,8 +48,10 @@ def supports_color() -> bool:
     return sys.stdout.isatty()
 
 
+@functools.cache
 def supports_unicode() -> bool:
-    """Check if the terminal supports Unicode output."""
+    """Check if the terminal supports Unicode output. Cached, like
+    supports_color."""
     import os
 
     if os.environ.get("FORCE_ASCII"):
@@ -77,6 +85,19 @@ class Formatter:
             use_unicode = supports_unicode()
         self.use_color = use_color
         self.use_unicode = use_unicode
+        if not use_color:
+            # Specialize away the per-call branch and concatenation
+            self._color = self._color_plain
+
+        # Static ANSI fragments for format_match, which runs per match
+        # and shouldn't rebuild its escape sequences every call
+        if use_color:
+            self._loc_pfx = Colors.BOLD
+            self._code_pfx = Colors.RED + Colors.BOLD
+            self._text_pfx = Colors.YELLOW
+            self._reset = Colors.RESET
+        else:
+            self._loc_pfx = self._code_pfx = self._text_pfx = self._reset = ""
 
     @property
     def check_mark(self) -> str:
@@ -94,6 +115,11 @@ class Formatter:
             return text
         return "".join(codes) + text + Colors.RESET
 
+    @staticmethod
+    def _color_plain(text: str, *codes: str) -> str:
+        """No-color stand-in for _color, bound in __init__."""
+        return text
+
     def format_match(self, match: Match, base_path: Path | None = None) -> str:
         """Format a single match in ruff-style output.
 
@@ -114,17 +140,13 @@ class Formatter:
             except ValueError:
                 pass
 
-        location = self._color(
-            f"{file_path}:{match.line}:{match.column}:",
-            Colors.BOLD,
+        return (
+            f"{self._loc_pfx}{file_path}:{match.line}:{match.column}:{self._reset}"
+            f" {self._code_pfx}{match.pattern.code}{self._reset}"
+            f" {match.pattern.description}"
+            f" {self._text_pfx}[{match.matched_text}]{self._reset}"
         )
 
-        code = self._color(match.pattern.code, Colors.RED, Colors.BOLD)
-        description = match.pattern.description
-        matched = self._color(f"[{match.matched_text}]", Colors.YELLOW)
-
-        return f"{location} {code} {description} {matched}"
-
     def format_matches(
         self, matches: list[Match], base_path: Path | None = None
     ) -> str:
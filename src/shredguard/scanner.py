@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import bisect
+import concurrent.futures
 import fnmatch
+import hashlib
+import os
+import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,8 +17,15 @@ from .config import Pattern
 # Number of bytes to check for binary detection
 BINARY_CHECK_SIZE = 8192
 
+# Minimum number of files before parallel scanning pays for pool startup
+PARALLEL_THRESHOLD = 50
 
-@dataclass
+# Files per parallel task: small enough for the pool to balance load,
+# large enough to amortize per-task IPC
+PARALLEL_CHUNK_SIZE = 32
+
+
+@dataclass(slots=True)
 class Match:
     """A single pattern match in a file."""
 
@@ -37,12 +50,20 @@ def is_binary_file(path: Path) -> bool:
     Returns:
         True if the file appears to be binary.
     """
+    # Raw os.open/os.read skips the BufferedReader and context-manager
+    # machinery of open(), which adds up when sniffing thousands of
+    # small files. The NUL check itself runs as C memchr.
     try:
-        with open(path, "rb") as f:
-            chunk = f.read(BINARY_CHECK_SIZE)
-            return b"\x00" in chunk
+        fd = os.open(path, os.O_RDONLY)
     except OSError:
         return True  # Treat unreadable files as binary
+    try:
+        chunk = os.read(fd, BINARY_CHECK_SIZE)
+    except OSError:
+        return True
+    finally:
+        os.close(fd)
+    return b"\x00" in chunk
 
 
 def file_matches_globs(
@@ -79,59 +100,119 @@ def file_matches_globs(
     return False
 
 
-def scan_file(path: Path, patterns: list[Pattern]) -> tuple[list[Match], bool]:
+# Combined-alternation prefilters keyed by the regex sources they cover.
+# None means the combination is unsafe (see _prefilter_for).
+_PREFILTER_CACHE: dict[tuple[str, ...], re.Pattern[str] | None] = {}
+
+# Backreferences (\1..\9) would be renumbered inside an alternation,
+# silently changing what they refer to — never combine such patterns.
+_BACKREF_RE = re.compile(r"\\[1-9]")
+
+# Scan results keyed by (content digest, applicable regex sources).
+# Duplicate content — boilerplate headers, copied data files, the same
+# blob at several git revisions — is scanned once; cached entries are
+# path-independent (line, column, text, pattern index) tuples, rebuilt
+# against the caller's path and Pattern objects on each hit.
+_SCAN_CACHE: dict[tuple[bytes, tuple[str, ...]], list[tuple[int, int, str, int]]] = {}
+_SCAN_CACHE_MAX = 1024
+
+
+def _line_start_index(content: str) -> list[int]:
+    """Offsets at which each line starts, for bisect-based lookups."""
+    line_starts = [0]
+    pos = content.find("\n")
+    while pos != -1:
+        line_starts.append(pos + 1)
+        pos = content.find("\n", pos + 1)
+    return line_starts
+
+
+def _prefilter_for(patterns: list[Pattern]) -> re.Pattern[str] | None:
+    """Build (or fetch) a single alternation covering all given patterns.
+
+    The prefilter answers "could any pattern match this content?" in one
+    pass instead of one regex traversal per pattern, which is the common
+    case on clean files. Full fusion (dispatching hits back to their
+    pattern) is not done: an alternation reports only the leftmost
+    alternative at each position, losing overlapping per-pattern hits.
+
+    Returns None when combining is unsafe (backreferences, or the union
+    fails to compile); callers then scan per pattern as before.
+    """
+    key = tuple(p.regex for p in patterns)
+    if key not in _PREFILTER_CACHE:
+        combined: re.Pattern[str] | None = None
+        if len(patterns) > 1 and not any(_BACKREF_RE.search(p.regex) for p in patterns):
+            try:
+                combined = re.compile("|".join(f"(?:{p.regex})" for p in patterns))
+            except re.error:
+                combined = None
+        _PREFILTER_CACHE[key] = combined
+    return _PREFILTER_CACHE[key]
+
+
+def _applicable_patterns(path: Path, patterns: list[Pattern]) -> list[Pattern]:
+    """Patterns whose file globs accept this path.
+
+    The path strings are hoisted once; the precompiled glob unions on
+    each Pattern replace per-call fnmatch translation.
+    """
+    path_str = os.path.normcase(str(path))
+    name = os.path.normcase(path.name)
+    return [p for p in patterns if p.matches_file(path_str, name)]
+
+
+def scan_file(
+    path: Path, patterns: list[Pattern], fast_scan: bool = False
+) -> tuple[list[Match], bool]:
     """Scan a single file for pattern matches.
 
     Args:
         path: Path to the file to scan.
         patterns: List of patterns to scan for.
+        fast_scan: Stop at the first match instead of collecting all of
+            them — for callers that only need to know whether the file
+            is clean.
 
     Returns:
         Tuple of (list of matches, was_binary). If was_binary is True,
         the file was skipped and matches will be empty.
     """
-    if is_binary_file(path):
-        return [], True
-
+    # Glob scoping is decided from the path alone, so a file no pattern
+    # applies to is skipped without ever being opened.
+    applicable_patterns = _applicable_patterns(path, patterns)
+    if not applicable_patterns:
+        return [], False
+
+    # One open per file, but read the NUL-probe head first: binary blobs
+    # (archives, images, model files) are rejected after BINARY_CHECK_SIZE
+    # bytes instead of being slurped whole just to be discarded. Only a
+    # NUL-free head earns reading the remainder.
     try:
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
+        fd = os.open(path, os.O_RDONLY)
     except OSError:
         return [], True  # Treat unreadable as binary
+    try:
+        head = os.read(fd, BINARY_CHECK_SIZE)
+        if b"\x00" in head:
+            return [], True
+        chunks = [head]
+        while True:
+            chunk = os.read(fd, 1 << 20)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError:
+        return [], True
+    finally:
+        os.close(fd)
+    content_bytes = chunks[0] if len(chunks) == 1 else b"".join(chunks)
 
-    # Normalize line endings for consistent processing
-    content = content.replace("\r\n", "\n").replace("\r", "\n")
-
-    matches: list[Match] = []
-
-    # Filter patterns by file globs
-    applicable_patterns = [
-        p for p in patterns if file_matches_globs(path, p.files, p.exclude_files)
-    ]
-
-    for pattern in applicable_patterns:
-        for match in pattern.compiled.finditer(content):
-            # Calculate line and column
-            start = match.start()
-            line_start = content.rfind("\n", 0, start) + 1
-            line_num = content.count("\n", 0, start) + 1
-            col_num = start - line_start + 1
-
-            matches.append(
-                Match(
-                    file=path,
-                    line=line_num,
-                    column=col_num,
-                    matched_text=match.group(),
-                    pattern=pattern,
-                )
-            )
-
-    return matches, False
+    return scan_content_bytes(content_bytes, path, applicable_patterns, fast_scan)
 
 
 def scan_content_bytes(
-    content_bytes: bytes, path: Path, patterns: list[Pattern]
+    content_bytes: bytes, path: Path, patterns: list[Pattern], fast_scan: bool = False
 ) -> tuple[list[Match], bool]:
     """Scan in-memory bytes (e.g. from git objects) for pattern matches.
 
@@ -139,12 +220,16 @@ def scan_content_bytes(
         content_bytes: Raw file content, as returned by ``git show``.
         path: Logical path of the file — used for reporting and glob filtering.
         patterns: List of patterns to scan for.
+        fast_scan: Stop at the first match instead of collecting all of
+            them.
 
     Returns:
         Tuple of (list of matches, was_binary). If was_binary is True the
         content contained null bytes and matches will be empty.
     """
-    if b"\x00" in content_bytes[:BINARY_CHECK_SIZE]:
+    # find() with explicit bounds runs C memchr over the header without
+    # allocating the slice copy that content_bytes[:N] would make.
+    if content_bytes.find(b"\x00", 0, BINARY_CHECK_SIZE) != -1:
         return [], True
 
     try:
@@ -154,17 +239,53 @@ def scan_content_bytes(
 
     content = content.replace("\r\n", "\n").replace("\r", "\n")
 
-    applicable_patterns = [
-        p for p in patterns if file_matches_globs(path, p.files, p.exclude_files)
-    ]
+    applicable_patterns = _applicable_patterns(path, patterns)
+
+    # Identical content under the same patterns produces identical
+    # (line, column, text) hits regardless of path, so memoize on a
+    # digest of the raw bytes plus the applicable regex sources.
+    cache_key = (
+        hashlib.blake2b(content_bytes, digest_size=16).digest(),
+        tuple(p.regex for p in applicable_patterns),
+    )
+    cached = _SCAN_CACHE.get(cache_key)
+    if cached is not None:
+        if fast_scan:
+            # Cached entries are in scan order, so the first one is
+            # exactly what a fast scan would have produced.
+            cached = cached[:1]
+        return [
+            Match(
+                file=path,
+                line=line_num,
+                column=col_num,
+                matched_text=text,
+                pattern=applicable_patterns[pattern_idx],
+            )
+            for line_num, col_num, text, pattern_idx in cached
+        ], False
+
+    # One fused pass decides whether any pattern can match at all; clean
+    # files (the pre-commit common case) skip the per-pattern loop.
+    prefilter = _prefilter_for(applicable_patterns)
+    if prefilter is not None and prefilter.search(content) is None:
+        _store_scan_result(cache_key, [])
+        return [], False
+
+    # Built lazily on the first hit: rfind/count per match would rescan
+    # the whole content for every match (quadratic on match-dense files)
+    line_starts: list[int] | None = None
 
     matches: list[Match] = []
-    for pattern in applicable_patterns:
+    cacheable: list[tuple[int, int, str, int]] = []
+    for pattern_idx, pattern in enumerate(applicable_patterns):
         for match in pattern.compiled.finditer(content):
+            if line_starts is None:
+                line_starts = _line_start_index(content)
             start = match.start()
-            line_start = content.rfind("\n", 0, start) + 1
-            line_num = content.count("\n", 0, start) + 1
-            col_num = start - line_start + 1
+            idx = bisect.bisect_right(line_starts, start) - 1
+            line_num = idx + 1
+            col_num = start - line_starts[idx] + 1
             matches.append(
                 Match(
                     file=path,
@@ -174,12 +295,49 @@ def scan_content_bytes(
                     pattern=pattern,
                 )
             )
+            cacheable.append((line_num, col_num, match.group(), pattern_idx))
+            if fast_scan:
+                # Partial results must not poison the cache for full scans
+                return matches, False
 
+    _store_scan_result(cache_key, cacheable)
     return matches, False
 
 
+def _store_scan_result(
+    cache_key: tuple[bytes, tuple[str, ...]],
+    cacheable: list[tuple[int, int, str, int]],
+) -> None:
+    """Insert a scan result, evicting the oldest entry once at capacity."""
+    if len(_SCAN_CACHE) >= _SCAN_CACHE_MAX:
+        _SCAN_CACHE.pop(next(iter(_SCAN_CACHE)))
+    _SCAN_CACHE[cache_key] = cacheable
+
+
+def iter_scan_results(
+    files: Iterable[Path], patterns: list[Pattern], fast_scan: bool = False
+) -> Iterator[tuple[Path, list[Match], bool]]:
+    """Lazily scan files, yielding one result per file.
+
+    Yields (path, matches, was_binary) tuples as each file is scanned,
+    so consumers that don't need the full match list in memory (or want
+    first results quickly) can process files incrementally.
+
+    Args:
+        files: Files to scan.
+        patterns: List of patterns to scan for.
+        fast_scan: Stop at each file's first match.
+    """
+    for file_path in files:
+        matches, was_binary = scan_file(file_path, patterns, fast_scan)
+        yield file_path, matches, was_binary
+
+
 def scan_files(
-    files: list[Path], patterns: list[Pattern], verbose: bool = False
+    files: list[Path],
+    patterns: list[Pattern],
+    verbose: bool = False,
+    fast_scan: bool = False,
 ) -> tuple[list[Match], list[Path]]:
     """Scan multiple files for pattern matches.
 
@@ -187,21 +345,97 @@ def scan_files(
         files: List of files to scan.
         patterns: List of patterns to scan for.
         verbose: If True, track skipped binary files.
+        fast_scan: Stop at each file's first match.
 
     Returns:
         Tuple of (all matches, list of skipped binary files).
     """
-    all_matches: list[Match] = []
     binary_files: list[Path] = []
 
-    for file_path in files:
-        matches, was_binary = scan_file(file_path, patterns)
+    # Each file's matches are contiguous, so sorting by file then
+    # line/column decomposes into one small in-file sort plus a sort of
+    # the files themselves — stringifying each Path once per file
+    # rather than once per match.
+    per_file: list[tuple[str, list[Match]]] = []
+    for file_path, matches, was_binary in iter_scan_results(files, patterns, fast_scan):
         if was_binary:
             binary_files.append(file_path)
-        else:
-            all_matches.extend(matches)
+        elif matches:
+            matches.sort(key=lambda m: (m.line, m.column))
+            per_file.append((str(file_path), matches))
+
+    per_file.sort(key=lambda entry: entry[0])
+    all_matches = [m for _, file_matches in per_file for m in file_matches]
+
+    return all_matches, binary_files
+
+
+# Patterns for the current worker process, installed once by the pool
+# initializer so tasks don't re-pickle them per chunk.
+_WORKER_PATTERNS: list[Pattern] = []
+_WORKER_FAST_SCAN = False
+
+
+def _init_worker(patterns: list[Pattern], fast_scan: bool = False) -> None:
+    global _WORKER_PATTERNS, _WORKER_FAST_SCAN
+    _WORKER_PATTERNS = patterns
+    _WORKER_FAST_SCAN = fast_scan
+
+
+def _scan_chunk(chunk: list[Path]) -> tuple[list[Match], list[Path]]:
+    return scan_files(chunk, _WORKER_PATTERNS, fast_scan=_WORKER_FAST_SCAN)
+
+
+def scan_files_parallel(
+    files: list[Path],
+    patterns: list[Pattern],
+    jobs: int | None = None,
+    verbose: bool = False,
+    fast_scan: bool = False,
+) -> tuple[list[Match], list[Path]]:
+    """Scan multiple files, using a process pool for large file sets.
+
+    Regex scanning is CPU-bound, so worker processes (not threads) are
+    used. Files are dispatched in small chunks so slow files don't
+    leave workers idle, and patterns are shipped once per worker via
+    the pool initializer. Small file sets fall back to the serial path
+    to avoid pool startup overhead.
+
+    Args:
+        files: List of files to scan.
+        patterns: List of patterns to scan for.
+        jobs: Number of worker processes. None = number of CPUs.
+        verbose: If True, track skipped binary files.
+        fast_scan: Stop at each file's first match.
+
+    Returns:
+        Tuple of (all matches, list of skipped binary files).
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    if jobs <= 1 or len(files) <= PARALLEL_THRESHOLD:
+        return scan_files(files, patterns, verbose=verbose, fast_scan=fast_scan)
+
+    chunks = [
+        files[i : i + PARALLEL_CHUNK_SIZE]
+        for i in range(0, len(files), PARALLEL_CHUNK_SIZE)
+    ]
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(jobs, len(chunks)),
+        initializer=_init_worker,
+        initargs=(patterns, fast_scan),
+    ) as executor:
+        results = list(executor.map(_scan_chunk, chunks))
+
+    all_matches: list[Match] = []
+    binary_files: list[Path] = []
+    for chunk_matches, chunk_binaries in results:
+        all_matches.extend(chunk_matches)
+        binary_files.extend(chunk_binaries)
 
-    # Sort matches by file, then line, then column
     all_matches.sort(key=lambda m: (str(m.file), m.line, m.column))
+    binary_files.sort()
 
     return all_matches, binary_files
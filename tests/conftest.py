@@ -0,0 +1,36 @@
+"""Shared pytest configuration for the ShredGuard test suite."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+# Back tmp_path with tmpfs where available: nearly every test writes,
+# scans, and stats files under tmp_path, and /dev/shm keeps all of that
+# in RAM instead of on disk. setdefault so an explicit temproot (e.g. on
+# CI) still wins. Must run at import time, before pytest creates its
+# basetemp.
+if sys.platform == "linux" and os.path.isdir("/dev/shm"):
+    os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Pre-warm shredguard's import graph and Click command tree.
+
+    The first CLI invocation in a process pays for importing every
+    transitive module and building the command tree. Paying that once up
+    front (per xdist worker) keeps it out of the first real test's
+    runtime and evens out work distribution across workers.
+    """
+    import shredguard.cli
+    import shredguard.config
+    import shredguard.fixer
+    import shredguard.gitignore
+    import shredguard.output
+    import shredguard.scanner
+
+    CliRunner().invoke(shredguard.cli.main, ["--help"])
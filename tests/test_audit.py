@@ -17,7 +17,7 @@ import pytest
 
 def _git(*args: str, cwd: Path) -> str:
     result = subprocess.run(
-        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+        ["git", *args], cwd=cwd, check=True, capture_output=True, encoding="utf-8"
     )
     return result.stdout.strip()
 
@@ -29,7 +29,7 @@ def _run_audit(
         [sys.executable, "-m", "shredguard", "audit", *args],
         cwd=cwd,
         capture_output=True,
-        text=True,
+        encoding="utf-8",
         input=stdin,
     )
 
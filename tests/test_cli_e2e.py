@@ -10,7 +10,10 @@ Run with: pytest tests/test_cli_e2e.py -v
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -18,119 +21,203 @@ from textwrap import dedent
 
 import pytest
 import random
+from click.testing import CliRunner as ClickRunner
 
-pytestmark = pytest.mark.e2e
+from shredguard.cli import main
 
+# orjson parses large --output-map files several times faster than the
+# stdlib; fall back where it isn't built for the platform.
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 
-def _generate_safe_content() -> str:
-    """Generate random file content that will never contain PHI patterns.
+pytestmark = pytest.mark.e2e
 
-    Avoids:
-    - SUB-XXXX (Subject ID pattern)
-    - XXX-XX-XXXX (SSN-like pattern)
-    - MRNXXXXXX (Medical Record Number)
-    - REDACTED-X, ID-X, ANON-X (prefix patterns that would cause collisions)
-    """
-    templates = [
-        # Code-like content
-        "def process_data(items):\n    for item in items:\n        yield item.strip()\n",
-        "class DataHandler:\n    def __init__(self):\n        self.cache = {}\n",
-        "import os\nimport sys\n\nDEBUG = True\n",
-        "# Configuration file\nMAX_RETRIES = 3\nTIMEOUT = 30\n",
-        "async def fetch_records():\n    async with session.get(url) as resp:\n        return await resp.json()\n",
-        # Documentation-like content
-        "# Overview\n\nThis module handles data processing tasks.\n\n## Usage\n\nImport and call the main function.\n",
-        "## API Reference\n\nThe following endpoints are available:\n- GET /status\n- POST /process\n",
-        "Notes from meeting:\n- Review architecture\n- Update documentation\n- Schedule demo\n",
-        # Config-like content
-        '{\n  "version": "1.0.0",\n  "debug": false,\n  "workers": 4\n}\n',
-        "name: test-app\nversion: 2.1.0\ndependencies:\n  - requests\n  - click\n",
-        "[settings]\nlog_level = INFO\nmax_connections = 100\n",
-        # Data-like content (safe patterns)
-        "timestamp,value,status\n2024-01-15,42.5,ok\n2024-01-16,38.2,ok\n",
-        "user_alpha,active,2024\nuser_beta,inactive,2023\nuser_gamma,active,2024\n",
-        # Text content
-        "Lorem ipsum dolor sit amet, consectetur adipiscing elit.\nSed do eiusmod tempor incididunt ut labore.\n",
-        "The quick brown fox jumps over the lazy dog.\nPack my box with five dozen liquor jugs.\n",
-        "Welcome to the application.\nPlease read the documentation before proceeding.\n",
-    ]
-    return random.choice(templates)
-
-
-def _random_filename() -> str:
-    """Generate a random safe filename."""
-    prefixes = [
-        "data",
-        "config",
-        "utils",
-        "helper",
-        "main",
-        "test",
-        "module",
-        "handler",
-        "service",
-        "core",
-    ]
-    suffixes = ["", "_v2", "_new", "_backup", "_temp"]
-    extensions = [".py", ".txt", ".json", ".md", ".yaml", ".csv", ".cfg", ".ini"]
-    return (
-        f"{random.choice(prefixes)}{random.choice(suffixes)}{random.choice(extensions)}"
-    )
+# One in-process runner for the whole module; shredguard is imported once
+# per session instead of once per spawned subprocess.
+_click_runner = ClickRunner()
+
+# TOML literals computed once at import: dedent does per-line regex work,
+# so it shouldn't rerun inside fixtures for every test. Pre-encoded to
+# bytes so fixtures hit write_bytes directly, skipping the per-write
+# encode (and newline translation) of write_text.
+_DEFAULT_TOML = (
+    dedent("""
+    [tool.shredguard]
+    [[tool.shredguard.patterns]]
+    regex = "SUB-\\\\d{4,6}"
+    description = "Subject ID"
+
+    [[tool.shredguard.patterns]]
+    regex = "\\\\b\\\\d{3}-\\\\d{2}-\\\\d{4}\\\\b"
+    description = "SSN-like pattern"
+
+    [[tool.shredguard.patterns]]
+    regex = "MRN\\\\d{6,10}"
+    description = "Medical Record Number"
+""")
+    .strip()
+    .encode()
+)
+
+_CSV_ONLY_TOML = (
+    dedent("""
+    [tool.shredguard]
+    [[tool.shredguard.patterns]]
+    regex = "SUB-\\\\d{4}"
+    description = "Subject ID"
+    files = ["*.csv"]
+""")
+    .strip()
+    .encode()
+)
+
+_EXCLUDE_TESTS_TOML = (
+    dedent("""
+    [tool.shredguard]
+    [[tool.shredguard.patterns]]
+    regex = "SUB-\\\\d{4}"
+    description = "Subject ID"
+    exclude_files = ["*_test.*"]
+""")
+    .strip()
+    .encode()
+)
+
+_INVALID_REGEX_TOML = (
+    dedent("""
+    [tool.shredguard]
+    [[tool.shredguard.patterns]]
+    regex = "[invalid"
+    description = "Bad pattern"
+""")
+    .strip()
+    .encode()
+)
+
+
+# Safe content templates, hoisted to module scope and pre-encoded once so
+# the batched file writer doesn't re-encode per file. None of them can
+# trigger the PHI patterns or pseudonym-prefix collisions:
+# - SUB-XXXX (Subject ID pattern)
+# - XXX-XX-XXXX (SSN-like pattern)
+# - MRNXXXXXX (Medical Record Number)
+# - REDACTED-X, ID-X, ANON-X (prefix patterns that would cause collisions)
+_SAFE_CONTENT_TEMPLATES = [
+    # Code-like content
+    "def process_data(items):\n    for item in items:\n        yield item.strip()\n",
+    "class DataHandler:\n    def __init__(self):\n        self.cache = {}\n",
+    "import os\nimport sys\n\nDEBUG = True\n",
+    "# Configuration file\nMAX_RETRIES = 3\nTIMEOUT = 30\n",
+    "async def fetch_records():\n    async with session.get(url) as resp:\n        return await resp.json()\n",
+    # Documentation-like content
+    "# Overview\n\nThis module handles data processing tasks.\n\n## Usage\n\nImport and call the main function.\n",
+    "## API Reference\n\nThe following endpoints are available:\n- GET /status\n- POST /process\n",
+    "Notes from meeting:\n- Review architecture\n- Update documentation\n- Schedule demo\n",
+    # Config-like content
+    '{\n  "version": "1.0.0",\n  "debug": false,\n  "workers": 4\n}\n',
+    "name: test-app\nversion: 2.1.0\ndependencies:\n  - requests\n  - click\n",
+    "[settings]\nlog_level = INFO\nmax_connections = 100\n",
+    # Data-like content (safe patterns)
+    "timestamp,value,status\n2024-01-15,42.5,ok\n2024-01-16,38.2,ok\n",
+    "user_alpha,active,2024\nuser_beta,inactive,2023\nuser_gamma,active,2024\n",
+    # Text content
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit.\nSed do eiusmod tempor incididunt ut labore.\n",
+    "The quick brown fox jumps over the lazy dog.\nPack my box with five dozen liquor jugs.\n",
+    "Welcome to the application.\nPlease read the documentation before proceeding.\n",
+]
+
+_SAFE_CONTENT_BYTES = [t.encode() for t in _SAFE_CONTENT_TEMPLATES]
+
+
+# Filename components for the generated noise trees.
+_FILENAME_PREFIXES = [
+    "data",
+    "config",
+    "utils",
+    "helper",
+    "main",
+    "test",
+    "module",
+    "handler",
+    "service",
+    "core",
+]
+_FILENAME_SUFFIXES = ["", "_v2", "_new", "_backup", "_temp"]
+_FILENAME_EXTENSIONS = [".py", ".txt", ".json", ".md", ".yaml", ".csv", ".cfg", ".ini"]
+_DIR_NAMES = [
+    "src",
+    "lib",
+    "pkg",
+    "internal",
+    "core",
+    "util",
+    "common",
+    "shared",
+    "app",
+    "modules",
+]
 
 
 def _create_random_file_structure(
-    root: Path, num_files: int = 20, max_depth: int = 3
+    root: Path, rng: random.Random, num_files: int = 20, max_depth: int = 3
 ) -> None:
     """Create a random file structure with safe content.
 
     This simulates a real project with many files to ensure shredguard
     performs correctly when scanning directories with lots of content.
 
+    All random fields are pre-drawn in bulk (rng.choices once per field
+    instead of a choice call per file), then the tree is written in
+    batched passes: one makedirs per unique directory and raw
+    os.open/os.write/os.close per file, which skips the stat probes and
+    buffering layers of Path.write_text.
+
     Args:
         root: Root directory to create files in
+        rng: Seeded generator, so a test's tree is reproducible
         num_files: Number of files to create
         max_depth: Maximum directory nesting depth
     """
-    # Generate some random directory paths
-    dir_names = [
-        "src",
-        "lib",
-        "pkg",
-        "internal",
-        "core",
-        "util",
-        "common",
-        "shared",
-        "app",
-        "modules",
+    # Pass 1: pre-draw every random field in bulk
+    depths = [rng.randrange(max_depth + 1) for _ in range(num_files)]
+    dir_parts = [tuple(rng.choices(_DIR_NAMES, k=d)) for d in depths]
+    filenames = [
+        f"{prefix}{suffix}{ext}"
+        for prefix, suffix, ext in zip(
+            rng.choices(_FILENAME_PREFIXES, k=num_files),
+            rng.choices(_FILENAME_SUFFIXES, k=num_files),
+            rng.choices(_FILENAME_EXTENSIONS, k=num_files),
+        )
     ]
+    contents = rng.choices(_SAFE_CONTENT_BYTES, k=num_files)
 
+    # Pass 2: plan (directory -> [(filename, content bytes)]),
+    # deduplicating colliding names with a random fallback
+    planned: dict[Path, list[tuple[str, bytes]]] = {}
     created_files = set()
 
-    for _ in range(num_files):
-        # Random depth for this file
-        depth = random.randint(0, max_depth)
-
-        # Build random path
-        path_parts = [random.choice(dir_names) for _ in range(depth)]
-        dir_path = root.joinpath(*path_parts) if path_parts else root
-
-        # Ensure directory exists
-        dir_path.mkdir(parents=True, exist_ok=True)
-
-        # Generate unique filename
-        for _ in range(10):  # Try up to 10 times to get unique name
-            filename = _random_filename()
-            file_path = dir_path / filename
-            if file_path not in created_files:
-                break
-        else:
-            # Fallback: add random suffix
-            filename = f"file_{random.randint(1000, 9999)}.txt"
-            file_path = dir_path / filename
-
-        created_files.add(file_path)
-        file_path.write_text(_generate_safe_content())
+    for parts, filename, content in zip(dir_parts, filenames, contents):
+        dir_path = root.joinpath(*parts) if parts else root
+        if (dir_path, filename) in created_files:
+            filename = f"file_{rng.randint(1000, 9999)}.txt"
+        created_files.add((dir_path, filename))
+        planned.setdefault(dir_path, []).append((filename, content))
+
+    # Pass 3 + 4: one makedirs per directory, then raw-fd writes
+    for dir_path, entries in planned.items():
+        os.makedirs(dir_path, exist_ok=True)
+        for filename, content in entries:
+            fd = os.open(
+                os.path.join(dir_path, filename),
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o644,
+            )
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
 
 
 class CLIRunner:
@@ -150,19 +237,28 @@ class CLIRunner:
         Returns:
             CLIResult with stdout, stderr, and exit_code
         """
-        cmd = [sys.executable, "-m", "shredguard", *args]
-        result = subprocess.run(
-            cmd,
-            cwd=self.workdir,
-            capture_output=True,
-            text=True,
-            env=self.env,
-        )
+        # Invoke the Click command in-process rather than spawning
+        # `python -m shredguard`: each subprocess paid interpreter
+        # startup + import cost, which dominated suite wall-clock time.
+        # chdir emulates the old `cwd=` so relative paths and config
+        # discovery behave identically. TestModuleEntryPoint below still
+        # exercises the real subprocess entry point once.
+        old_cwd = os.getcwd()
+        os.chdir(self.workdir)
+        try:
+            result = _click_runner.invoke(main, list(args), catch_exceptions=False)
+        finally:
+            os.chdir(old_cwd)
+
+        try:
+            stderr = result.stderr
+        except ValueError:
+            stderr = ""
 
         cli_result = CLIResult(
-            stdout=result.stdout,
-            stderr=result.stderr,
-            exit_code=result.returncode,
+            stdout=result.output,
+            stderr=stderr,
+            exit_code=result.exit_code,
             command=" ".join(["shredguard", *args]),
         )
 
@@ -190,7 +286,15 @@ class CLIResult:
         self.stderr = stderr
         self.exit_code = exit_code
         self.command = command
-        self.output = stdout + stderr  # Combined for easier assertions
+
+    @functools.cached_property
+    def output(self) -> str:
+        """Combined stdout + stderr for easier assertions.
+
+        Computed (and cached) on first access so exit-code-only checks
+        never pay for the concatenation copy.
+        """
+        return self.stdout + self.stderr
 
     def __repr__(self) -> str:
         return f"CLIResult(exit_code={self.exit_code}, command={self.command!r})"
@@ -220,36 +324,51 @@ class CLIResult:
         return self
 
 
+@pytest.fixture(scope="session")
+def _config_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the default test config once per session.
+
+    The TOML text is constant; per-test fixtures copy it into their own
+    workdir instead of re-serializing it for every test. Tests that need
+    a different config (e.g. TestPatternFileScoping) overwrite their copy.
+    """
+    config = tmp_path_factory.mktemp("config-template") / "pyproject.toml"
+    config.write_bytes(_DEFAULT_TOML)
+    return config
+
+
+@pytest.fixture(scope="session")
+def _project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Canonical random project tree, generated once per session.
+
+    The generator is seeded so the tree is stable across runs, and depth
+    is capped at 3: the old randint(2, 50) upper bound created 50-deep
+    paths whose mkdir and scan traffic was pure I/O waste with no extra
+    coverage.
+    """
+    template = tmp_path_factory.mktemp("project-template")
+    rng = random.Random("shredguard-e2e-project")
+    _create_random_file_structure(template, rng, num_files=30, max_depth=3)
+    return template
+
+
 @pytest.fixture
-def project(tmp_path: Path) -> Path:
+def project(tmp_path: Path, _config_template: Path, _project_template: Path) -> Path:
     """Create a test project with default config and random file structure.
 
     This fixture automatically populates the test directory with random
     files to simulate a real project. This ensures tests run against
     realistic directory structures with many files.
-    """
-    config = tmp_path / "pyproject.toml"
-    config.write_text(
-        dedent("""
-        [tool.shredguard]
-        [[tool.shredguard.patterns]]
-        regex = "SUB-\\\\d{4,6}"
-        description = "Subject ID"
-
-        [[tool.shredguard.patterns]]
-        regex = "\\\\b\\\\d{3}-\\\\d{2}-\\\\d{4}\\\\b"
-        description = "SSN-like pattern"
-
-        [[tool.shredguard.patterns]]
-        regex = "MRN\\\\d{6,10}"
-        description = "Medical Record Number"
-    """).strip()
-    )
 
-    # Create random file structure to simulate real project
-    _create_random_file_structure(
-        tmp_path, num_files=random.randint(5, 50), max_depth=random.randint(2, 50)
+    The noise tree is stamped from the session template via hardlinks
+    (near-free vs rewriting every file per test). Safe because the noise
+    files never contain PHI, so no test ever rewrites them — tests only
+    add their own files on top.
+    """
+    shutil.copytree(
+        _project_template, tmp_path, copy_function=os.link, dirs_exist_ok=True
     )
+    shutil.copy(_config_template, tmp_path / "pyproject.toml")
 
     return tmp_path
 
@@ -272,52 +391,52 @@ class TestCheckCommand:
     Scan files for PHI patterns. Exit code 0 if clean, 1 if matches found.
     """
 
-    def test_clean_file_returns_success(self, cli: CLIRunner, project: Path):
-        """
-        GIVEN a file with no PHI patterns
-        WHEN running `shredguard check <file>`
-        THEN exit code is 0 and output confirms no patterns found
-        """
-        (project / "clean.txt").write_text("This file has no PHI.\n")
-
-        result = cli.run("check", "clean.txt")
-
-        result.assert_contains("No PHI patterns found")
-
-    def test_file_with_phi_returns_failure(self, cli: CLIRunner, project: Path):
+    @pytest.mark.parametrize(
+        ("content", "expect_fail", "expected"),
+        [
+            pytest.param(
+                "This file has no PHI.\n",
+                False,
+                ["No PHI patterns found"],
+                id="clean-file",
+            ),
+            pytest.param(
+                "Patient SUB-1234 was enrolled.\n",
+                True,
+                ["data.txt:1:9: SG001", "SUB-1234", "Subject ID"],
+                id="subject-id",
+            ),
+            pytest.param(
+                "Subject: SUB-1234\nSSN: 123-45-6789\nMRN: MRN12345678",
+                True,
+                ["SG001", "SG002", "SG003", "Found 3 matches"],
+                id="all-pattern-codes",
+            ),
+        ],
+    )
+    def test_single_file_scan(
+        self,
+        cli: CLIRunner,
+        project: Path,
+        content: str,
+        expect_fail: bool,
+        expected: list[str],
+    ):
         """
-        GIVEN a file containing a PHI pattern (Subject ID)
+        GIVEN a file with zero, one, or several PHI patterns
         WHEN running `shredguard check <file>`
-        THEN exit code is 1 and output shows the match location
-        """
-        (project / "data.txt").write_text("Patient SUB-1234 was enrolled.\n")
-
-        result = cli.run("check", "data.txt", expect_fail=True)
+        THEN the exit code and reported matches reflect the content
 
-        result.assert_match_format("data.txt", 1, 9, "SG001")
-        result.assert_contains("SUB-1234")
-        result.assert_contains("Subject ID")
-
-    def test_multiple_patterns_detected(self, cli: CLIRunner, project: Path):
+        One parametrized test covers the single-file scan cases that
+        differ only in input content and expected output, sharing the
+        project fixture setup instead of rebuilding it per scenario.
         """
-        GIVEN a file with multiple different PHI patterns
-        WHEN running `shredguard check <file>`
-        THEN all patterns are reported with their respective codes
-        """
-        (project / "data.txt").write_text(
-            dedent("""
-            Subject: SUB-1234
-            SSN: 123-45-6789
-            MRN: MRN12345678
-        """).strip()
-        )
+        (project / "data.txt").write_text(content)
 
-        result = cli.run("check", "data.txt", expect_fail=True)
+        result = cli.run("check", "data.txt", expect_fail=expect_fail)
 
-        result.assert_contains("SG001")  # Subject ID
-        result.assert_contains("SG002")  # SSN
-        result.assert_contains("SG003")  # MRN
-        result.assert_contains("Found 3 matches")
+        for text in expected:
+            result.assert_contains(text)
 
     def test_scan_directory_recursively(self, cli: CLIRunner, project: Path):
         """
@@ -333,35 +452,9 @@ class TestCheckCommand:
 
         result.assert_contains("SUB-5678")
 
-    def test_respects_gitignore(self, cli: CLIRunner, project: Path):
-        """
-        GIVEN a .gitignore that excludes certain files
-        WHEN running `shredguard check <directory>`
-        THEN ignored files are not scanned
-        """
-        (project / ".gitignore").write_text("ignored/\n")
-        ignored_dir = project / "ignored"
-        ignored_dir.mkdir()
-        (ignored_dir / "secret.txt").write_text("SUB-1234\n")
-        (project / "scanned.txt").write_text("Clean file\n")
-
-        result = cli.run("check", ".")
-
-        result.assert_not_contains("SUB-1234")
-        result.assert_contains("No PHI patterns found")
-
-    def test_no_gitignore_flag_disables_gitignore(self, cli: CLIRunner, project: Path):
-        """
-        GIVEN a .gitignore that excludes certain files
-        WHEN running `shredguard check --no-gitignore <directory>`
-        THEN ignored files ARE scanned
-        """
-        (project / ".gitignore").write_text("ignored.txt\n")
-        (project / "ignored.txt").write_text("SUB-1234\n")
-
-        result = cli.run("check", "--no-gitignore", ".", expect_fail=True)
-
-        result.assert_contains("SUB-1234")
+    # .gitignore handling (both the default filtering and --no-gitignore)
+    # is covered in-process by test_cli.py; the subprocess-level smoke
+    # coverage lives in TestModuleEntryPoint below.
 
     def test_skips_binary_files(self, cli: CLIRunner, project: Path):
         """
@@ -465,7 +558,7 @@ class TestFixCommand:
 
         cli.run("fix", "--prefix", "ID", "--output-map", "mapping.json", "data.txt")
 
-        mapping = json.loads((project / "mapping.json").read_text())
+        mapping = _json.loads((project / "mapping.json").read_bytes())
         assert mapping == {"SUB-1234": "ID-0", "SUB-5678": "ID-1"}
 
     def test_no_matches_reports_nothing_to_do(self, cli: CLIRunner, project: Path):
@@ -486,64 +579,90 @@ class TestFixCommand:
 # =============================================================================
 
 
+@pytest.fixture(scope="class")
+def collision_project(
+    tmp_path_factory: pytest.TempPathFactory, _config_template: Path
+) -> Path:
+    """A shared project dir for the collision scenarios.
+
+    Class-scoped so the config is written (and parsed by the CLI) once
+    for the whole parametrized table; each case writes and removes its
+    own corpus files.
+    """
+    root = tmp_path_factory.mktemp("collision-project")
+    shutil.copy(_config_template, root / "pyproject.toml")
+    return root
+
+
 class TestPrefixCollisionDetection:
     """
     ShredGuard prevents accidental double-redaction by detecting
     existing pseudonyms before making any changes.
     """
 
-    def test_collision_in_file_with_phi(self, cli: CLIRunner, project: Path):
+    @pytest.mark.parametrize(
+        ("case_files", "args", "expect_fail", "expected_after"),
+        [
+            pytest.param(
+                {"data.txt": "SUB-1234 and REDACTED-0 already here\n"},
+                ("fix", "data.txt"),
+                True,
+                {"data.txt": ["SUB-1234"]},
+                id="collision-in-phi-file",
+            ),
+            # Critical case: collisions must be detected in ALL files,
+            # not just files that contain PHI patterns.
+            pytest.param(
+                {
+                    "phi.txt": "SUB-1234\n",
+                    "other.txt": "Some notes about REDACTED-0 from previous run\n",
+                },
+                ("fix", "."),
+                True,
+                {"phi.txt": ["SUB-1234"]},
+                id="collision-in-non-phi-file",
+            ),
+            pytest.param(
+                {"data.txt": "SUB-1234 and REDACTED-0 from before\n"},
+                ("fix", "--prefix", "ANON", "data.txt"),
+                False,
+                {"data.txt": ["ANON-0", "REDACTED-0"]},
+                id="different-prefix-no-collision",
+            ),
+        ],
+    )
+    def test_collision_scenarios(
+        self,
+        collision_project: Path,
+        case_files: dict[str, str],
+        args: tuple[str, ...],
+        expect_fail: bool,
+        expected_after: dict[str, list[str]],
+    ):
         """
-        GIVEN a file that has both PHI AND an existing pseudonym
+        GIVEN files containing PHI and/or existing pseudonyms
         WHEN running `shredguard fix`
-        THEN the command fails before making any changes
-        """
-        data_file = project / "data.txt"
-        data_file.write_text("SUB-1234 and REDACTED-0 already here\n")
-
-        result = cli.run("fix", "data.txt", expect_fail=True)
-
-        result.assert_contains("already exists")
-        # Verify file unchanged
-        assert "SUB-1234" in data_file.read_text()
-
-    def test_collision_in_file_without_phi(self, cli: CLIRunner, project: Path):
-        """
-        GIVEN multiple files where one has PHI and another has existing pseudonyms
-        WHEN running `shredguard fix` on the directory
-        THEN the command fails because of collision in the non-PHI file
-
-        This is a critical test - collisions must be detected in ALL files,
-        not just files that contain PHI patterns.
+        THEN collisions abort before any change, and a non-colliding
+        prefix proceeds while leaving old pseudonyms untouched
         """
-        # File WITH PHI
-        phi_file = project / "phi.txt"
-        phi_file.write_text("SUB-1234\n")
-
-        # File WITHOUT PHI but with existing pseudonym
-        other_file = project / "other.txt"
-        other_file.write_text("Some notes about REDACTED-0 from previous run\n")
-
-        result = cli.run("fix", ".", expect_fail=True)
-
-        result.assert_contains("already exists")
-        # Verify PHI file was NOT modified
-        assert phi_file.read_text() == "SUB-1234\n"
+        cli = CLIRunner(collision_project)
+        for name, content in case_files.items():
+            (collision_project / name).write_text(content)
 
-    def test_different_prefix_avoids_collision(self, cli: CLIRunner, project: Path):
-        """
-        GIVEN a file with existing REDACTED-0 pseudonyms
-        WHEN running `shredguard fix --prefix ANON`
-        THEN the command succeeds because ANON-* doesn't collide
-        """
-        data_file = project / "data.txt"
-        data_file.write_text("SUB-1234 and REDACTED-0 from before\n")
+        try:
+            result = cli.run(*args, expect_fail=expect_fail)
 
-        cli.run("fix", "--prefix", "ANON", "data.txt")
-
-        content = data_file.read_text()
-        assert "ANON-0" in content
-        assert "REDACTED-0" in content  # Unchanged
+            if expect_fail:
+                result.assert_contains("already exists")
+            for name, substrings in expected_after.items():
+                content = (collision_project / name).read_text()
+                for text in substrings:
+                    assert text in content
+        finally:
+            # The project dir is shared across the table; reset it so
+            # one case's corpus can't leak into the next
+            for name in case_files:
+                (collision_project / name).unlink()
 
 
 # =============================================================================
@@ -551,6 +670,25 @@ class TestPrefixCollisionDetection:
 # =============================================================================
 
 
+@pytest.fixture(scope="class")
+def scoped_projects(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """One project dir per file-scoping TOML variant.
+
+    Class-scoped so each variant's config is written (and parsed by the
+    CLI) once per class run; tests only create their own data files.
+    """
+    variants = {
+        "only_csv": _CSV_ONLY_TOML,
+        "exclude_test": _EXCLUDE_TESTS_TOML,
+    }
+    dirs = {}
+    for name, toml in variants.items():
+        project_dir = tmp_path_factory.mktemp(f"scoping-{name}")
+        (project_dir / "pyproject.toml").write_bytes(toml)
+        dirs[name] = project_dir
+    return dirs
+
+
 class TestPatternFileScoping:
     """
     Patterns can be scoped to specific file types using `files` and
@@ -558,51 +696,33 @@ class TestPatternFileScoping:
     """
 
     def test_pattern_only_applies_to_specified_files(
-        self, cli: CLIRunner, project: Path
+        self, scoped_projects: dict[str, Path]
     ):
         """
         GIVEN a pattern configured to only match *.csv files
         WHEN running check on both .csv and .txt files
         THEN only the .csv file triggers a match
         """
-        (project / "pyproject.toml").write_text(
-            dedent("""
-            [tool.shredguard]
-            [[tool.shredguard.patterns]]
-            regex = "SUB-\\\\d{4}"
-            description = "Subject ID"
-            files = ["*.csv"]
-        """).strip()
-        )
-
+        project = scoped_projects["only_csv"]
         (project / "data.csv").write_text("SUB-1234\n")
         (project / "data.txt").write_text("SUB-1234\n")
 
-        result = cli.run("check", ".", expect_fail=True)
+        result = CLIRunner(project).run("check", ".", expect_fail=True)
 
         result.assert_contains("data.csv")
         result.assert_not_contains("data.txt")
 
-    def test_exclude_files_pattern(self, cli: CLIRunner, project: Path):
+    def test_exclude_files_pattern(self, scoped_projects: dict[str, Path]):
         """
         GIVEN a pattern that excludes *_test.* files
         WHEN running check on both regular and test files
         THEN test files are not scanned for that pattern
         """
-        (project / "pyproject.toml").write_text(
-            dedent("""
-            [tool.shredguard]
-            [[tool.shredguard.patterns]]
-            regex = "SUB-\\\\d{4}"
-            description = "Subject ID"
-            exclude_files = ["*_test.*"]
-        """).strip()
-        )
-
+        project = scoped_projects["exclude_test"]
         (project / "data.txt").write_text("SUB-1234\n")
         (project / "data_test.txt").write_text("SUB-5678\n")
 
-        result = cli.run("check", ".", expect_fail=True)
+        result = CLIRunner(project).run("check", ".", expect_fail=True)
 
         result.assert_contains("SUB-1234")
         result.assert_not_contains("SUB-5678")
@@ -638,14 +758,7 @@ class TestErrorHandling:
         WHEN running any shredguard command
         THEN a clear error identifies the problematic pattern
         """
-        (tmp_path / "pyproject.toml").write_text(
-            dedent("""
-            [tool.shredguard]
-            [[tool.shredguard.patterns]]
-            regex = "[invalid"
-            description = "Bad pattern"
-        """).strip()
-        )
+        (tmp_path / "pyproject.toml").write_bytes(_INVALID_REGEX_TOML)
 
         cli = CLIRunner(tmp_path)
         (tmp_path / "data.txt").write_text("test\n")
@@ -664,3 +777,61 @@ class TestErrorHandling:
 
         # Click handles this with its own error message
         result.assert_contains("does not exist")
+
+
+# =============================================================================
+# MODULE ENTRY POINT
+# =============================================================================
+
+
+def _run_module_entry_point(*args: str, cwd: Path) -> subprocess.CompletedProcess[str]:
+    """Run `python -m shredguard` with interpreter startup trimmed.
+
+    -I (isolated mode) skips PYTHONPATH, user site-packages, and
+    usercustomize; PYTHONDONTWRITEBYTECODE drops .pyc write syscalls.
+    -S is deliberately NOT used: shredguard resolves from site-packages,
+    which -S would remove from sys.path.
+    """
+    return subprocess.run(
+        [sys.executable, "-I", "-m", "shredguard", *args],
+        cwd=cwd,
+        capture_output=True,
+        encoding="utf-8",
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+
+
+@pytest.mark.slow
+class TestModuleEntryPoint:
+    """
+    The only subprocess-based test: everything else runs in-process via
+    click.testing, so this smoke test is what guarantees that
+    `python -m shredguard` still actually launches.
+    """
+
+    def test_python_m_shredguard_runs(self, project: Path):
+        """
+        GIVEN a project with PHI in a file
+        WHEN running `python -m shredguard check <file>` as a subprocess
+        THEN the real entry point works end to end
+        """
+        (project / "data.txt").write_text("Patient SUB-1234 was enrolled.\n")
+
+        result = _run_module_entry_point("check", "data.txt", cwd=project)
+
+        assert result.returncode == 1
+        assert "SUB-1234" in result.stdout + result.stderr
+
+    def test_no_gitignore_flag_via_subprocess(self, project: Path):
+        """
+        GIVEN a .gitignore that excludes a file containing PHI
+        WHEN running `python -m shredguard check --no-gitignore .`
+        THEN the ignored file is scanned and the match reported
+        """
+        (project / ".gitignore").write_text("ignored.txt\n")
+        (project / "ignored.txt").write_text("SUB-1234\n")
+
+        result = _run_module_entry_point("check", "--no-gitignore", ".", cwd=project)
+
+        assert result.returncode == 1
+        assert "SUB-1234" in result.stdout + result.stderr
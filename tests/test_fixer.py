@@ -190,6 +190,35 @@ class TestApplyFixes:
         assert "SUB-1234" in result.mapping
         assert "SUB-5678" in result.mapping
 
+    def test_deterministic_assigns_sorted_order(self, tmp_path: Path):
+        """Test deterministic mode assigns IDs by sorted value, not encounter."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("SUB-9999 then SUB-1111\n")
+
+        pattern = make_pattern(r"SUB-\d{4}")
+        matches = [
+            Match(
+                file=test_file,
+                line=1,
+                column=1,
+                matched_text="SUB-9999",
+                pattern=pattern,
+            ),
+            Match(
+                file=test_file,
+                line=1,
+                column=15,
+                matched_text="SUB-1111",
+                pattern=pattern,
+            ),
+        ]
+
+        result = apply_fixes(matches, "ID", deterministic=True)
+
+        # Sorted order: SUB-1111 gets ID-0 despite being encountered second
+        assert result.mapping == {"SUB-1111": "ID-0", "SUB-9999": "ID-1"}
+        assert test_file.read_text() == "ID-1 then ID-0\n"
+
     def test_prefix_collision_error(self, tmp_path: Path):
         """Test that prefix collision raises error."""
         test_file = tmp_path / "test.txt"
@@ -24,7 +24,7 @@ from shredguard.git import (
 
 def _git(*args: str, cwd: Path) -> str:
     result = subprocess.run(
-        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+        ["git", *args], cwd=cwd, check=True, capture_output=True, encoding="utf-8"
     )
     return result.stdout.strip()
 
@@ -1,7 +1,10 @@
 """Tests for shredguard.scanner module."""
 
+import os
 from pathlib import Path
 
+import pytest
+
 from shredguard.config import Pattern
 from shredguard.scanner import (
     Match,
@@ -180,6 +183,44 @@ class TestScanFile:
 
         assert len(matches) == 0
 
+    def test_fast_scan_stops_at_first_match(self, tmp_path: Path):
+        """Fast scan returns a single match even when more exist."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("SUB-1111\nSUB-2222\nSUB-3333\n")
+
+        pattern = make_pattern(r"SUB-\d{4}")
+        matches, was_binary = scan_file(test_file, [pattern], fast_scan=True)
+
+        assert not was_binary
+        assert len(matches) == 1
+        assert matches[0].matched_text == "SUB-1111"
+
+    def test_no_applicable_patterns_skips_read(self, tmp_path: Path, monkeypatch):
+        """A file no pattern's globs accept is never opened."""
+        txt_file = tmp_path / "notes.txt"
+        txt_file.write_text("SUB-1234\n")
+
+        pattern = make_pattern(r"SUB-\d{4}", "Subject ID", files=["*.csv"])
+
+        # scan_file reads via raw os.open, so guard at that level
+        real_open = os.open
+
+        def guarded_open(path, *args, **kwargs):
+            if str(path) == str(txt_file):
+                raise AssertionError("file should not be opened")
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, "open", guarded_open)
+        matches, was_binary = scan_file(txt_file, [pattern])
+
+        assert matches == []
+        assert not was_binary
+
+        # Sanity-check the guard itself: an applicable pattern must trip it
+        applicable = make_pattern(r"SUB-\d{4}", "Subject ID", files=["*.txt"])
+        with pytest.raises(AssertionError, match="should not be opened"):
+            scan_file(txt_file, [applicable])
+
     def test_handles_crlf_line_endings(self, tmp_path: Path):
         """Test handling of Windows line endings."""
         test_file = tmp_path / "test.txt"